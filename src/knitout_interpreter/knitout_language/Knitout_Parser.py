@@ -1,9 +1,11 @@
 """Parser code for accessing Parglare language support"""
-import re
+from collections.abc import Iterable
+from functools import cache
 
 import importlib_resources
 import parglare.exceptions
 from parglare import Parser, Grammar
+from parglare.tables import LRTable, create_load_table
 
 import knitout_interpreter
 from knitout_interpreter.knitout_language.knitout_actions import action
@@ -16,12 +18,12 @@ class Knitout_Parser:
     """
 
     def __init__(self, debug_grammar: bool = False, debug_parser: bool = False, debug_parser_layout: bool = False):
-        pg_resource_stream = importlib_resources.files(knitout_interpreter.knitout_language).joinpath('knitout.pg')
-        self._grammar: Grammar = Grammar.from_file(pg_resource_stream, debug=debug_grammar, ignore_case=True)
+        self._grammar: Grammar = _knitout_grammar(debug_grammar)
+        self._table: LRTable = _knitout_table(self._grammar)
         self._set_parser(debug_parser, debug_parser_layout)
 
     def _set_parser(self, debug_parser: bool, debug_parser_layout: bool):
-        self._parser: Parser = Parser(self._grammar, debug=debug_parser, debug_layout=debug_parser_layout, actions=action.all)
+        self._parser: Parser = Parser(self._grammar, debug=debug_parser, debug_layout=debug_parser_layout, actions=action.all, table=self._table)
         self._parser.knitout_parser = self  # make this structure available from actions
 
     def parse_knitout_to_instructions(self, pattern: str, pattern_is_file: bool = False,
@@ -35,16 +37,21 @@ class Knitout_Parser:
         :param pattern_is_file: If true, assume that the pattern is parsed from a file.
         :return: List of knitout instructions created by parsing given pattern.
         """
-        codes: list[Knitout_Line] = []
         if reset_parser:
             self._set_parser(debug_parser, debug_parser_layout)
         if pattern_is_file:
             with open(pattern, "r") as pattern_file:
-                lines = pattern_file.readlines()
-        else:
-            lines = pattern.splitlines()
+                return self._parse_lines(pattern_file)
+        return self._parse_lines(pattern.splitlines())
+
+    def _parse_lines(self, lines: Iterable[str]) -> list[Knitout_Line]:
+        """
+        :param lines: Knitout lines to parse. File objects are consumed one line at a time.
+        :return: List of knitout instructions created by parsing the given lines.
+        """
+        codes: list[Knitout_Line] = []
         for i, line in enumerate(lines):
-            if not re.match(r'^\s*$', line):
+            if line and not line.isspace():
                 try:
                     code = self._parser.parse(line)
                 except parglare.exceptions.ParseError as e:
@@ -58,6 +65,27 @@ class Knitout_Parser:
         return codes
 
 
+@cache
+def _knitout_grammar(debug_grammar: bool = False) -> Grammar:
+    """
+    The knitout grammar is read once per process and shared by every parser.
+    :param debug_grammar: Print grammar debugging.
+    :return: The knitout grammar.
+    """
+    pg_resource_stream = importlib_resources.files(knitout_interpreter.knitout_language).joinpath('knitout.pg')
+    return Grammar.from_file(pg_resource_stream, debug=debug_grammar, ignore_case=True)
+
+
+@cache
+def _knitout_table(grammar: Grammar) -> LRTable:
+    """
+    Loads the LR table from knitout.pgt, or builds and saves it when the grammar is newer than the table file.
+    :param grammar: The knitout grammar.
+    :return: The LR table for the grammar, shared by every parser of that grammar.
+    """
+    return create_load_table(grammar, prefer_shifts=True, prefer_shifts_over_empty=True)
+
+
 def parse_knitout(pattern: str, pattern_is_file: bool = False, debug_parser: bool = False, debug_parser_layout: bool = False) -> list[Knitout_Line]:
     """
     Executes the parsing code for the parglare parser.
@@ -1,19 +1,26 @@
 """Actions for reducing in Knitout Parser"""
+import re
+import sys
+from functools import lru_cache
+
 from parglare import get_collector
 from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
 from virtual_knitting_machine.machine_components.needles.Needle import Needle
 from virtual_knitting_machine.machine_components.needles.Slider_Needle import Slider_Needle
 from virtual_knitting_machine.machine_components.yarn_management.Yarn_Carrier_Set import Yarn_Carrier_Set
 
-from knitout_interpreter.knitout_operations.Header_Line import Knitout_Header_Line, Machine_Header_Line, Gauge_Header_Line, Yarn_Header_Line, Carriers_Header_Line, Position_Header_Line
+from knitout_interpreter.knitout_operations.Header_Line import Machine_Header_Line, Gauge_Header_Line, Yarn_Header_Line, Carriers_Header_Line, Position_Header_Line
 from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line, Knitout_Comment_Line, Knitout_Version_Line
 from knitout_interpreter.knitout_operations.Pause_Instruction import Pause_Instruction
 from knitout_interpreter.knitout_operations.Rack_Instruction import Rack_Instruction
-from knitout_interpreter.knitout_operations.carrier_instructions import In_Instruction, Inhook_Instruction, Releasehook_Instruction, Out_Instruction, Outhook_Instruction
+from knitout_interpreter.knitout_operations.carrier_instructions import Yarn_Carrier_Instruction, CARRIER_INSTRUCTION_CLASSES
 from knitout_interpreter.knitout_operations.needle_instructions import Knit_Instruction, Tuck_Instruction, Miss_Instruction, Split_Instruction, Drop_Instruction, Xfer_Instruction
 
 action = get_collector()
 
+_NEEDLE_ID = re.compile(r"([fb])(s?)(\d+)")
+_DIRECTIONS: dict[str, Carriage_Pass_Direction] = {d: Carriage_Pass_Direction.get_direction(d) for d in ("+", "-")}
+
 
 @action
 def comment(_, __, content: str | None) -> str | None:
@@ -22,9 +29,11 @@ def comment(_, __, content: str | None) -> str | None:
     :param _:
     :param __:
     :param content: the content of the comment.
-    :return: the content of the comment.
+    :return: the content of the comment, interned so that repeated comments share one string.
     """
-    return content
+    if content is None:
+        return None
+    return sys.intern(content)
 
 
 @action
@@ -56,17 +65,6 @@ def magic_string(_, __, v: int) -> Knitout_Version_Line:
     return Knitout_Version_Line(v)
 
 
-@action
-def header_line(_, __, h_op: Knitout_Header_Line) -> Knitout_Header_Line:
-    """
-    :param _: The parser element that created this value
-    :param __:
-    :param h_op: operation on the line
-    :return: the header operation
-    """
-    return h_op
-
-
 @action
 def machine_op(_, __, m: str) -> Machine_Header_Line:
     """
@@ -126,59 +124,27 @@ def position_op(_, __, p: str) -> Position_Header_Line:
     return Position_Header_Line(p)
 
 
-@action
-def in_op(_, __, c: int) -> In_Instruction:
+def _carrier_op(instruction_class: type[Yarn_Carrier_Instruction]):
     """
-    :param c: The carrier to bring in.
-    :param _: The parser element that created this value.
-    :param __:
-    :return: In operation on a carrier set.
+    Parsed instructions are mutable execution records, so each reduction builds a new instruction.
+    :param instruction_class: The carrier instruction class to construct.
+    :return: A reducer that creates the given carrier instruction on a carrier.
     """
-    return In_Instruction(c)
 
+    def op(_, __, c: int) -> Yarn_Carrier_Instruction:
+        """
+        :param _: The parser element that created this value.
+        :param __:
+        :param c: The carrier to operate on.
+        :return: Carrier instruction on the carrier.
+        """
+        return instruction_class(c)
 
-@action
-def inhook_op(_, __, c: int) -> Inhook_Instruction:
-    """
-    :param c:
-    :param _: The parser element that created this value
-    :param __:
-    :return: Inhook operation on carrier set
-    """
-    return Inhook_Instruction(c)
-
-
-@action
-def releasehook_op(_, __, c: int) -> Releasehook_Instruction:
-    """
-    :param _: The parser element that created this value
-    :param __:
-    :param c: carrier set
-    :return: releasehook operation on carrier set
-    """
-    return Releasehook_Instruction(c)
-
-
-@action
-def out_op(_, __, c: int) -> Out_Instruction:
-    """
-    :param _: The parser element that created this value
-    :param __:
-    :param c: carrier set
-    :return: out operation on the carrier set
-    """
-    return Out_Instruction(c)
+    return op
 
 
-@action
-def outhook_op(_, __, c: int) -> Outhook_Instruction:
-    """
-    :param _: The parser element that created this value
-    :param __:
-    :param c: carrier set
-    :return: outhook operation on the carrier set
-    """
-    return Outhook_Instruction(c)
+for _instruction_type, _instruction_class in CARRIER_INSTRUCTION_CLASSES.items():
+    action(f"{_instruction_type}_op")(_carrier_op(_instruction_class))
 
 
 @action
@@ -193,7 +159,7 @@ def rack_op(_, __, R: float) -> Rack_Instruction:
 
 
 @action
-def knit_op(_, __, D: str, N: Needle, CS: Yarn_Carrier_Set) -> Knit_Instruction:
+def knit_op(_, __, D: Carriage_Pass_Direction, N: Needle, CS: Yarn_Carrier_Set) -> Knit_Instruction:
     """
     :param _: The parser element that created this value
     :param __:
@@ -202,11 +168,11 @@ def knit_op(_, __, D: str, N: Needle, CS: Yarn_Carrier_Set) -> Knit_Instruction:
     :param CS: a carrier set
     :return: knit operation
     """
-    return Knit_Instruction(N, Carriage_Pass_Direction.get_direction(D), CS)
+    return Knit_Instruction(N, D, CS)
 
 
 @action
-def tuck_op(_, __, D: str, N: Needle, CS: Yarn_Carrier_Set) -> Tuck_Instruction:
+def tuck_op(_, __, D: Carriage_Pass_Direction, N: Needle, CS: Yarn_Carrier_Set) -> Tuck_Instruction:
     """
     :param _: The parser element that created this value
     :param __:
@@ -215,11 +181,11 @@ def tuck_op(_, __, D: str, N: Needle, CS: Yarn_Carrier_Set) -> Tuck_Instruction:
     :param CS: a carrier set
     :return: tuck operation
     """
-    return Tuck_Instruction(N, Carriage_Pass_Direction.get_direction(D), CS)
+    return Tuck_Instruction(N, D, CS)
 
 
 @action
-def miss_op(_, __, D: str, N: Needle, CS: Yarn_Carrier_Set) -> Miss_Instruction:
+def miss_op(_, __, D: Carriage_Pass_Direction, N: Needle, CS: Yarn_Carrier_Set) -> Miss_Instruction:
     """
     :param _: The parser element that created this value
     :param __:
@@ -228,11 +194,11 @@ def miss_op(_, __, D: str, N: Needle, CS: Yarn_Carrier_Set) -> Miss_Instruction:
     :param CS: a carrier set
     :return: miss operation
     """
-    return Miss_Instruction(N, Carriage_Pass_Direction.get_direction(D), CS)
+    return Miss_Instruction(N, D, CS)
 
 
 @action
-def split_op(_, __, D: str, N: Needle, N2: Needle, CS: Yarn_Carrier_Set) -> Split_Instruction:
+def split_op(_, __, D: Carriage_Pass_Direction, N: Needle, N2: Needle, CS: Yarn_Carrier_Set) -> Split_Instruction:
     """
     :param N2: second needle to move to.
     :param _: The parser element that created this value
@@ -242,7 +208,17 @@ def split_op(_, __, D: str, N: Needle, N2: Needle, CS: Yarn_Carrier_Set) -> Spli
     :param CS: a carrier set
     :return: knit operation
     """
-    return Split_Instruction(N, Carriage_Pass_Direction.get_direction(D), N2, CS)
+    return Split_Instruction(N, D, N2, CS)
+
+
+@action
+def direction(_, nodes: list[str]) -> Carriage_Pass_Direction:
+    """
+    :param _: The parser element that created this value
+    :param nodes: the matched direction symbol, "+" or "-"
+    :return: the carriage pass direction of the symbol
+    """
+    return _DIRECTIONS[nodes[0]]
 
 
 @action
@@ -279,51 +255,58 @@ def pause_op(_, __) -> Pause_Instruction:
 
 
 @action
-def identifier(_, node: str) -> str:
+def float_exp(_, node: str) -> float:
     """
     :param _:
-    :param node: identifier string
-    :return: node
+    :param node: float string, already restricted to digits, "." and "-" by the float_exp terminal
+    :return: float conversion
     """
-    return node
+    return float(node)
 
 
 @action
-def float_exp(_, node: str) -> float:
+def int_exp(_, node: str) -> int:
     """
     :param _:
-    :param node: float string
-    :return: float conversion
+    :param node: int string, already restricted to digits and "-" by the int_exp terminal
+    :return: int conversion
     """
-    digits = ""
-    for c in node:
-        if c.isdigit() or c == "." or c == "-":
-            digits += c
-    return float(digits)
+    return _to_int(node)
 
 
-@action
-def int_exp(_, node: str) -> int:
+@lru_cache(maxsize=1024)
+def _to_int(node: str) -> int:
     """
-    :param _:
+    Carrier ids, gauges and versions repeat heavily, and a cache lookup is cheaper than int() on a string.
     :param node: int string
     :return: int conversion
     """
-    return int(float_exp(None, node))
+    return int(node)
 
 
 @action
 def needle_id(_, node: str) -> Needle:
-    is_front = "f" in node
-    slider = "s" in node
-    num_str = node[1:]  # cut bed off
-    if slider:
-        num_str = node[1:]  # cut slider off
-    pos = int(num_str)
-    if slider:
-        return Slider_Needle(is_front, pos)
+    """
+    :param _:
+    :param node: needle string of the form [fb]s?[0-9]+
+    :return: Needle or Slider_Needle identified by the string
+    """
+    is_front, position, is_slider = _needle_location(node)
+    if is_slider:
+        return Slider_Needle(is_front, position)
     else:
-        return Needle(is_front, pos)
+        return Needle(is_front, position)
+
+
+@lru_cache(maxsize=8192)
+def _needle_location(node: str) -> tuple[bool, int, bool]:
+    """
+    Only the parsed location is cached. Each instruction gets its own Needle because needles hold loops.
+    :param node: needle string of the form [fb]s?[0-9]+
+    :return: Tuple of whether the needle is on the front bed, its position, and whether it is a slider.
+    """
+    bed, slider, position = _NEEDLE_ID.match(node.lower()).groups()
+    return bed == "f", int(position), slider == "s"
 
 
 @action
@@ -23,43 +23,54 @@ class Knitout_Header_Line_Type(Enum):
 
 
 class Knitout_Header_Line(Knitout_Line):
+    __slots__ = ("header_value", "header_type")
 
     def __init__(self, header_type: Knitout_Header_Line_Type, header_value, comment: str | None):
         super().__init__(comment)
         self.header_value = header_value
         self.header_type: Knitout_Header_Line_Type = header_type
 
+    def _format_header(self) -> str:
+        """
+        :return: The header declaration without its comment.
+        """
+        return f";;{self.header_type}: {self.header_value}"
+
     def __str__(self):
-        return f";;{self.header_type}: {self.header_value}{self.comment_str}"
+        return f"{self._format_header()}{self.comment_str}"
 
 
 class Machine_Header_Line(Knitout_Header_Line):
+    __slots__ = ()
 
     def __init__(self, machine_type: str, comment: str | None = None):
         super().__init__(Knitout_Header_Line_Type.Machine, machine_type, comment)
 
 
 class Gauge_Header_Line(Knitout_Header_Line):
+    __slots__ = ()
 
     def __init__(self, gauge: int, comment: str | None = None):
         super().__init__(Knitout_Header_Line_Type.Gauge, gauge, comment)
 
 
 class Position_Header_Line(Knitout_Header_Line):
+    __slots__ = ()
 
     def __init__(self, position: str, comment: str | None = None):
         super().__init__(Knitout_Header_Line_Type.Position, position, comment)
 
 
 class Yarn_Header_Line(Knitout_Header_Line):
+    __slots__ = ("yarn_properties", "carrier_id")
 
     def __init__(self, carrier_id: int, plies: int, yarn_weight: float, color, comment: str | None = None):
         self.yarn_properties = Yarn_Properties(f"{plies}-{yarn_weight}-{color}", plies, yarn_weight, color)
         self.carrier_id = carrier_id
         super().__init__(Knitout_Header_Line_Type.Yarn, self.yarn_properties, comment)
 
-    def __str__(self):
-        return f";;{self.header_type}-{self.carrier_id}: {self.yarn_properties.plies}-{self.yarn_properties.weight} {self.yarn_properties.color}{self.comment_str}"
+    def _format_header(self) -> str:
+        return f";;{self.header_type}-{self.carrier_id}: {self.yarn_properties.plies}-{self.yarn_properties.weight} {self.yarn_properties.color}"
 
     def execute(self, machine_state: Knitting_Machine) -> bool:
         machine_state.carrier_system[self.carrier_id].yarn = self.yarn_properties
@@ -67,6 +78,7 @@ class Yarn_Header_Line(Knitout_Header_Line):
 
 
 class Carriers_Header_Line(Knitout_Header_Line):
+    __slots__ = ()
 
     def __init__(self, carrier_ids: list[int], comment: str | None = None):
         super().__init__(Knitout_Header_Line_Type.Carriers, carrier_ids, comment)
@@ -1,16 +1,19 @@
 """Base class for Knitout Lines of code"""
+from itertools import count
+
 from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
 
+_next_line = count(1).__next__
+
 
 class Knitout_Line:
     """
         General class for lines of knitout
     """
-    _Lines_Made = 0
+    __slots__ = ("_creation_time", "_comment", "_comment_str", "original_line_number", "follow_comments")
 
     def __init__(self, comment: str | None):
-        Knitout_Line._Lines_Made += 1
-        self._creation_time = Knitout_Line._Lines_Made
+        self._creation_time = _next_line()
         self.comment = comment
         self.original_line_number: int | None = None
         self.follow_comments: list[Knitout_Comment_Line] = []
@@ -22,22 +25,34 @@ class Knitout_Line:
         """
         self.follow_comments.append(comment_line)
 
+    @property
+    def comment(self) -> str | None:
+        """
+        :return: The comment that follows this line, if any.
+        """
+        return self._comment
+
+    @comment.setter
+    def comment(self, comment: str | None):
+        self._comment: str | None = comment
+        if comment is None:
+            self._comment_str: str = "\n"
+        else:
+            self._comment_str = f";{comment}\n"
+
     @property
     def has_comment(self) -> bool:
         """
         :return: True if comment is present
         """
-        return self.comment is not None
+        return self._comment is not None
 
     @property
     def comment_str(self) -> str:
         """
-        :return: comment as a string
+        :return: comment as a string, formatted when the comment is set.
         """
-        if not self.has_comment:
-            return "\n"
-        else:
-            return f";{self.comment}\n"
+        return self._comment_str
 
     def execute(self, machine_state: Knitting_Machine) -> bool:
         """
@@ -85,10 +100,11 @@ class Knitout_Line:
             return self.original_line_number < other.original_line_number
 
     def __hash__(self):
-        return hash(self._creation_time)
+        return self._creation_time
 
 
 class Knitout_Version_Line(Knitout_Line):
+    __slots__ = ("version",)
 
     def __init__(self, version: int = 2, comment: None | str = None):
         super().__init__(comment)
@@ -99,12 +115,13 @@ class Knitout_Version_Line(Knitout_Line):
 
 
 class Knitout_Comment_Line(Knitout_Line):
+    __slots__ = ()
+
     def __init__(self, comment: None | str | Knitout_Line):
-        if isinstance(comment, Knitout_Line):
-            if isinstance(comment, Knitout_Comment_Line):
-                comment = Knitout_Comment_Line.comment_str
-            else:
-                comment = f"No-Op:\t{comment}"
+        if isinstance(comment, Knitout_Comment_Line):
+            comment = comment.comment
+        elif isinstance(comment, Knitout_Line):
+            comment = f"No-Op:\t{str(comment).rstrip()}"
         super().__init__(comment)
 
     def execute(self, machine_state: Knitting_Machine) -> bool:
@@ -3,6 +3,8 @@ from knitout_interpreter.knitout_operations.knitout_instruction import Knitout_I
 
 
 class Pause_Instruction(Knitout_Instruction):
+    __slots__ = ()
+
     def __init__(self, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Pause, comment)
 
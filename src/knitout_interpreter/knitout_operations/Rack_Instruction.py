@@ -5,6 +5,7 @@ from knitout_interpreter.knitout_operations.knitout_instruction import Knitout_I
 
 
 class Rack_Instruction(Knitout_Instruction):
+    __slots__ = ("_rack_value",)
 
     def __init__(self, rack: float, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Rack, comment)
@@ -28,10 +29,10 @@ class Rack_Instruction(Knitout_Instruction):
     def rack_value(self) -> float:
         return self._rack_value
 
-    def __str__(self):
+    def _format_instruction(self) -> str:
         if not self.all_needle_rack:
-            return f"{self.instruction_type} {int(self._rack_value)}{self.comment_str}"
-        return f"{self.instruction_type} {self._rack_value}{self.comment_str}"
+            return f"{self.instruction_type} {int(self._rack_value)}"
+        return f"{self.instruction_type} {self._rack_value}"
 
     def execute(self, machine_state: Knitting_Machine):
         if machine_state.rack == self.rack and machine_state.all_needle_rack == self.all_needle_rack:
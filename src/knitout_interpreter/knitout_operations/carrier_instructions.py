@@ -11,14 +11,15 @@ from knitout_interpreter.knitout_operations.knitout_instruction import Knitout_I
 
 
 class Yarn_Carrier_Instruction(Knitout_Instruction):
+    __slots__ = ("carrier", "carrier_id")
 
     def __init__(self, instruction_type: Knitout_Instruction_Type, carrier: int | Yarn_Carrier, comment: None | str):
         super().__init__(instruction_type, comment)
         self.carrier: int | Yarn_Carrier = carrier
         self.carrier_id: int = int(self.carrier)
 
-    def __str__(self):
-        return f"{self.instruction_type} {self.carrier_id}{self.comment_str}"
+    def _format_instruction(self) -> str:
+        return f"{self.instruction_type} {self.carrier_id}"
 
     def get_yarn(self, machine: Knitting_Machine) -> Machine_Knit_Yarn:
         """
@@ -36,12 +37,11 @@ class Yarn_Carrier_Instruction(Knitout_Instruction):
 
 
 class Hook_Instruction(Yarn_Carrier_Instruction):
-
-    def __init__(self, instruction_type: Knitout_Instruction_Type, carrier: int | Yarn_Carrier, comment: None | str):
-        super().__init__(instruction_type, carrier, comment)
+    __slots__ = ()
 
 
 class In_Instruction(Yarn_Carrier_Instruction):
+    __slots__ = ()
 
     def __init__(self, carrier: int | Yarn_Carrier, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.In, carrier, comment)
@@ -52,6 +52,7 @@ class In_Instruction(Yarn_Carrier_Instruction):
 
 
 class Inhook_Instruction(Hook_Instruction):
+    __slots__ = ()
 
     def __init__(self, carrier_set: Yarn_Carrier | int, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Inhook, carrier_set, comment)
@@ -62,10 +63,13 @@ class Inhook_Instruction(Hook_Instruction):
 
 
 class Releasehook_Instruction(Hook_Instruction):
+    __slots__ = ("_preferred_release_direction",)
 
     def __init__(self, carrier: int | Yarn_Carrier, comment: None | str = None, preferred_release_direction: Carriage_Pass_Direction | None = None):
         super().__init__(Knitout_Instruction_Type.Releasehook, carrier, comment)
-        self._preferred_release_direction = preferred_release_direction
+        if preferred_release_direction is None:
+            preferred_release_direction = Carriage_Pass_Direction.Leftward
+        self._preferred_release_direction: Carriage_Pass_Direction = preferred_release_direction
 
     @property
     def preferred_release_direction(self) -> Carriage_Pass_Direction:
@@ -73,18 +77,20 @@ class Releasehook_Instruction(Hook_Instruction):
         :return: The preferred direction to release this carrier in.
         Will default to leftward release.
         """
-        if self._preferred_release_direction is None:
-            return Carriage_Pass_Direction.Leftward
         return self._preferred_release_direction
 
     def execute(self, machine_state: Knitting_Machine):
-        if self.carrier_id != machine_state.carrier_system.hooked_carrier.carrier_id:
+        hooked_carrier = machine_state.carrier_system.hooked_carrier
+        if hooked_carrier is None or hooked_carrier.carrier_id != self.carrier_id:
             warnings.warn(Mismatched_Releasehook_Warning(self.carrier_id))
+            if hooked_carrier is None:
+                return False
         machine_state.release_hook()
         return True
 
 
 class Out_Instruction(Yarn_Carrier_Instruction):
+    __slots__ = ()
 
     def __init__(self, carrier: int | Yarn_Carrier, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Out, carrier, comment)
@@ -95,6 +101,7 @@ class Out_Instruction(Yarn_Carrier_Instruction):
 
 
 class Outhook_Instruction(Hook_Instruction):
+    __slots__ = ()
 
     def __init__(self, carrier_set: Yarn_Carrier | int, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Outhook, carrier_set, comment)
@@ -102,3 +109,12 @@ class Outhook_Instruction(Hook_Instruction):
     def execute(self, machine_state: Knitting_Machine):
         machine_state.out_hook(self.carrier_id)
         return True
+
+
+CARRIER_INSTRUCTION_CLASSES: dict[Knitout_Instruction_Type, type[Yarn_Carrier_Instruction]] = {
+    Knitout_Instruction_Type.In: In_Instruction,
+    Knitout_Instruction_Type.Inhook: Inhook_Instruction,
+    Knitout_Instruction_Type.Releasehook: Releasehook_Instruction,
+    Knitout_Instruction_Type.Out: Out_Instruction,
+    Knitout_Instruction_Type.Outhook: Outhook_Instruction,
+}
@@ -1,12 +1,12 @@
 """Structure for Instructions"""
-from enum import Enum
+from enum import StrEnum
 
 from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
 
 from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Line
 
 
-class Knitout_Instruction_Type(Enum):
+class Knitout_Instruction_Type(StrEnum):
     """
         Knitout Instruction types
     """
@@ -25,9 +25,6 @@ class Knitout_Instruction_Type(Enum):
     Miss = "miss"
     Pause = "pause"
 
-    def __str__(self):
-        return self.value
-
     def __repr__(self):
         return str(self)
 
@@ -38,31 +35,28 @@ class Knitout_Instruction_Type(Enum):
         :param inst_str: instruction string to pull from
         :return: Instruction_Type Enum of that type
         """
-        return Knitout_Instruction_Type[inst_str.capitalize()]
+        return _INSTRUCTION_BY_NAME[inst_str.lower()]
 
     @property
     def is_carrier_instruction(self) -> bool:
         """
         :return: True if instruction operates on yarn carriers
         """
-        return self in [Knitout_Instruction_Type.In, Knitout_Instruction_Type.Inhook,
-                        Knitout_Instruction_Type.Releasehook,
-                        Knitout_Instruction_Type.Out, Knitout_Instruction_Type.Outhook]
+        return self in _CARRIER_INSTRUCTIONS
 
     @property
     def is_needle_instruction(self) -> bool:
         """
         :return: True if operation operates on needles
         """
-        return self in [Knitout_Instruction_Type.Knit, Knitout_Instruction_Type.Tuck, Knitout_Instruction_Type.Split,
-                        Knitout_Instruction_Type.Drop, Knitout_Instruction_Type.Xfer]
+        return self in _NEEDLE_INSTRUCTIONS
 
     @property
     def in_knitting_pass(self) -> bool:
         """
         :return: True if instruction can be done in a knit pass
         """
-        return self in [Knitout_Instruction_Type.Knit, Knitout_Instruction_Type.Tuck]  # Todo: test miss and drop operations
+        return self in _KNITTING_PASS_INSTRUCTIONS
 
     @property
     def all_needle_instruction(self) -> bool:
@@ -76,7 +70,7 @@ class Knitout_Instruction_Type(Enum):
         """
         :return: True if instruction requires a direction
         """
-        return self in [Knitout_Instruction_Type.Knit, Knitout_Instruction_Type.Tuck, Knitout_Instruction_Type.Miss, Knitout_Instruction_Type.Split]
+        return self in _DIRECTED_INSTRUCTIONS
 
     @property
     def requires_carrier(self) -> bool:
@@ -90,7 +84,7 @@ class Knitout_Instruction_Type(Enum):
         """
         :return: True if instruction requires second needle
         """
-        return self in [Knitout_Instruction_Type.Xfer, Knitout_Instruction_Type.Split]
+        return self in _TWO_NEEDLE_INSTRUCTIONS
 
     @property
     def allow_sliders(self) -> bool:
@@ -111,25 +105,42 @@ class Knitout_Instruction_Type(Enum):
         :param other_instruction: Needle_Instruction to see if they match the pass type
         :return: True if both instructions could be executed in a pass
         """
-        if not self.is_needle_instruction:
-            return False
-        elif self.in_knitting_pass and other_instruction.in_knitting_pass:
-            return True
-        else:
-            return self is other_instruction
+        pass_group = _PASS_GROUPS.get(self)
+        return pass_group is not None and pass_group is _PASS_GROUPS.get(other_instruction)
+
+
+_INSTRUCTION_BY_NAME: dict[str, Knitout_Instruction_Type] = {t.value: t for t in Knitout_Instruction_Type}
+_CARRIER_INSTRUCTIONS: frozenset[Knitout_Instruction_Type] = frozenset({Knitout_Instruction_Type.In, Knitout_Instruction_Type.Inhook,
+                                                                       Knitout_Instruction_Type.Releasehook,
+                                                                       Knitout_Instruction_Type.Out, Knitout_Instruction_Type.Outhook})
+_NEEDLE_INSTRUCTIONS: frozenset[Knitout_Instruction_Type] = frozenset({Knitout_Instruction_Type.Knit, Knitout_Instruction_Type.Tuck, Knitout_Instruction_Type.Split,
+                                                                      Knitout_Instruction_Type.Drop, Knitout_Instruction_Type.Xfer})
+_KNITTING_PASS_INSTRUCTIONS: frozenset[Knitout_Instruction_Type] = frozenset({Knitout_Instruction_Type.Knit, Knitout_Instruction_Type.Tuck})  # Todo: test miss and drop operations
+_DIRECTED_INSTRUCTIONS: frozenset[Knitout_Instruction_Type] = frozenset({Knitout_Instruction_Type.Knit, Knitout_Instruction_Type.Tuck, Knitout_Instruction_Type.Miss, Knitout_Instruction_Type.Split})
+_TWO_NEEDLE_INSTRUCTIONS: frozenset[Knitout_Instruction_Type] = frozenset({Knitout_Instruction_Type.Xfer, Knitout_Instruction_Type.Split})
+# Needle instructions that can share a carriage pass map to the same group. Knitting pass instructions share the Knit group.
+_PASS_GROUPS: dict[Knitout_Instruction_Type, Knitout_Instruction_Type] = {t: Knitout_Instruction_Type.Knit if t in _KNITTING_PASS_INSTRUCTIONS else t
+                                                                          for t in _NEEDLE_INSTRUCTIONS}
 
 
 class Knitout_Instruction(Knitout_Line):
     """
         Superclass for knitout operations
     """
+    __slots__ = ("instruction_type",)
 
     def __init__(self, instruction_type: Knitout_Instruction_Type, comment: str | None):
         super().__init__(comment)
         self.instruction_type: Knitout_Instruction_Type = instruction_type
 
+    def _format_instruction(self) -> str:
+        """
+        :return: The instruction without its comment.
+        """
+        return f"{self.instruction_type}"
+
     def __str__(self):
-        return f"{self.instruction_type}{self.comment_str}"
+        return f"{self._format_instruction()}{self.comment_str}"
 
     def execute(self, machine_state: Knitting_Machine) -> bool:
         """
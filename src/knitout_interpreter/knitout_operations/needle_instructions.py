@@ -13,6 +13,7 @@ from knitout_interpreter.knitout_operations.knitout_instruction import Knitout_I
 
 
 class Needle_Instruction(Knitout_Instruction):
+    __slots__ = ("carrier_set", "needle_2", "direction", "needle", "carriage_pass", "made_loops", "moved_loops")
 
     def __init__(self, instruction_type: Knitout_Instruction_Type,
                  needle: Needle, direction: None | str | Carriage_Pass_Direction = None, needle_2: None | Needle = None,
@@ -26,7 +27,7 @@ class Needle_Instruction(Knitout_Instruction):
         self.direction: None | Carriage_Pass_Direction = direction
         self.needle = needle
         self.carriage_pass = None
-        self.made_loops = None
+        self.made_loops: list[Loop] | tuple[()] = ()
         self.moved_loops = None
 
     def get_yarns(self, knitting_machine: Knitting_Machine) -> dict[int, Machine_Knit_Yarn]:
@@ -87,34 +88,22 @@ class Needle_Instruction(Knitout_Instruction):
         if self.instruction_type.requires_carrier:
             assert self.has_carrier_set, f"Cannot {self.instruction_type} without a carrier set"
 
-    def __str__(self):
-        if self.has_direction:
-            dir_str = f" {self.direction}"
-        else:
-            dir_str = ""
-        if self.has_second_needle:
-            n2_str = f" {self.needle_2}"
-        else:
-            n2_str = ""
-        if self.has_carrier_set:
-            cs_str = f" {self.carrier_set}"
-        else:
-            cs_str = ""
-        return f"{self.instruction_type}{dir_str} {self.needle}{n2_str}{cs_str}{self.comment_str}"
+    def _format_instruction(self) -> str:
+        dir_str = "" if self.direction is None else f" {self.direction}"
+        n2_str = "" if self.needle_2 is None else f" {self.needle_2}"
+        cs_str = "" if self.carrier_set is None else f" {self.carrier_set}"
+        return f"{self.instruction_type}{dir_str} {self.needle}{n2_str}{cs_str}"
 
 
 class Loop_Making_Instruction(Needle_Instruction):
-
-    def __init__(self, instruction_type: Knitout_Instruction_Type,
-                 needle: Needle, direction: None | str | Carriage_Pass_Direction = None,
-                 needle_2: None | Needle = None,
-                 carrier_set: Yarn_Carrier_Set = None,
-                 comment: None | str = None):
-        super().__init__(instruction_type, needle, direction, needle_2, carrier_set, comment)
-        self.made_loops: list[Loop] = []
+    """
+        Superclass for needle instructions that make new loops.
+    """
+    __slots__ = ()
 
 
 class Knit_Instruction(Loop_Making_Instruction):
+    __slots__ = ()
 
     def __init__(self, needle: Needle, direction: str | Carriage_Pass_Direction, cs: Yarn_Carrier_Set, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Knit, needle, direction=direction, carrier_set=cs, comment=comment)
@@ -126,6 +115,7 @@ class Knit_Instruction(Loop_Making_Instruction):
 
 
 class Tuck_Instruction(Loop_Making_Instruction):
+    __slots__ = ()
 
     def __init__(self, needle: Needle, direction: str | Carriage_Pass_Direction, cs: Yarn_Carrier_Set, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Tuck, needle, direction=direction, carrier_set=cs, comment=comment)
@@ -133,14 +123,15 @@ class Tuck_Instruction(Loop_Making_Instruction):
     def execute(self, machine_state: Knitting_Machine):
         self._test_operation()
         self.made_loops = machine_state.tuck(self.carrier_set, self.needle, self.direction)
-        return len(self.made_loops) > 0
+        return bool(self.made_loops)
 
 
 class Split_Instruction(Loop_Making_Instruction):
+    __slots__ = ("transferred_loops",)
 
     def __init__(self, needle: Needle, direction: Carriage_Pass_Direction, n2: Needle, cs: Yarn_Carrier_Set, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Split, needle, direction=direction, needle_2=n2, carrier_set=cs, comment=comment)
-        self.transferred_loops: list[Loop] = []
+        self.transferred_loops: list[Loop] | tuple[()] = ()
 
     def execute(self, machine_state: Knitting_Machine):
         self._test_operation()
@@ -148,10 +139,11 @@ class Split_Instruction(Loop_Making_Instruction):
         if aligned_needle != self.needle_2:
             raise Misaligned_Needle_Exception(self.needle, self.needle_2)
         self.made_loops, self.transferred_loops = machine_state.split(self.carrier_set, self.needle, self.direction)
-        return len(self.made_loops) > 0 or len(self.transferred_loops) > 0
+        return bool(self.made_loops) or bool(self.transferred_loops)
 
 
 class Drop_Instruction(Needle_Instruction):
+    __slots__ = ()
 
     def __init__(self, needle: Needle, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Drop, needle, comment=comment)
@@ -163,6 +155,7 @@ class Drop_Instruction(Needle_Instruction):
 
 
 class Xfer_Instruction(Needle_Instruction):
+    __slots__ = ("record_location", "loop_crossings_made")
 
     def __init__(self, needle: Needle, n2: Needle, comment: None | str = None, record_location=True):
         super().__init__(Knitout_Instruction_Type.Xfer, needle, needle_2=n2, comment=comment)
@@ -181,10 +174,11 @@ class Xfer_Instruction(Needle_Instruction):
         if aligned_needle != self.needle_2:
             raise Misaligned_Needle_Exception(self.needle, self.needle_2)
         transferred_loops = self.made_loops = machine_state.xfer(self.needle, to_slider=to_slider)
-        return len(transferred_loops) > 0
+        return bool(transferred_loops)
 
 
 class Miss_Instruction(Needle_Instruction):
+    __slots__ = ()
 
     def __init__(self, needle: Needle, direction: str | Carriage_Pass_Direction, cs: Yarn_Carrier_Set, comment: None | str = None):
         super().__init__(Knitout_Instruction_Type.Miss, needle, direction=direction, carrier_set=cs, comment=comment)
@@ -1,80 +1,121 @@
 """Basic tests of the Knitout Interpreter"""
+import logging
+import os
 from unittest import TestCase
 
 from knit_graphs.knit_graph_visualizer.Stitch_Visualizer import visualize_stitches
+from virtual_knitting_machine.Knitting_Machine import Knitting_Machine
+from virtual_knitting_machine.knitting_machine_exceptions.Needle_Exception import Misaligned_Needle_Exception
 
+from knitout_interpreter.knitout_language.Knitout_Parser import parse_knitout
 from knitout_interpreter.run_knitout import run_knitout
 
+_logger = logging.getLogger(__name__)
+
+_VISUALIZE = os.environ.get("KNITOUT_TEST_VIZ", "").lower() in ("1", "true", "yes")
+
+
+def _visualize_stitches(knit_graph, **kwargs):
+    """
+    Visualizes the knit graph only when KNITOUT_TEST_VIZ is 1, true or yes, so default test runs skip rendering.
+    :param knit_graph: The knit graph to visualize.
+    :param kwargs: Passed through to visualize_stitches.
+    """
+    if _VISUALIZE:
+        visualize_stitches(knit_graph, **kwargs)
+
 
 class Test(TestCase):
     def test_run_knitout(self):
         execution, machine, knit_graph = run_knitout("single_knit.k")
-        print(execution)
-        print(machine.front_loops())
+        front_loops = machine.front_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("%s", front_loops)
         assert knit_graph.has_loop
-        assert len(machine.front_loops()) == 1
+        assert len(front_loops) == 1
 
     def test_stst_square(self):
         execution, machine, knit_graph = run_knitout("stst_square.k")
-        print(execution)
-        print(machine.front_loops())
-        visualize_stitches(knit_graph)
-        assert len(machine.front_loops()) == 4
+        front_loops = machine.front_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("%s", front_loops)
+        _visualize_stitches(knit_graph)
+        assert len(front_loops) == 4
 
     def test_tube(self):
         execution, machine, knit_graph = run_knitout("tube.k")
-        print(execution)
-        print(f"Front Loops: {machine.front_loops()}")
-        print(f"Back Loops: {machine.back_loops()}")
-        print(f"In Front of Floats: {machine.carrier_system[1].yarn.loops_in_front_of_floats()}")
-        print(f"Behind Floats: {machine.carrier_system[1].yarn.loops_behind_floats()}")
-        visualize_stitches(knit_graph, start_on_left=True)
-        assert len(machine.front_loops()) == 2
-        assert len(machine.back_loops()) == 2
+        front_loops = machine.front_loops()
+        back_loops = machine.back_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("Front Loops: %s", front_loops)
+        _logger.debug("Back Loops: %s", back_loops)
+        _logger.debug("In Front of Floats: %s", machine.carrier_system[1].yarn.loops_in_front_of_floats())
+        _logger.debug("Behind Floats: %s", machine.carrier_system[1].yarn.loops_behind_floats())
+        _visualize_stitches(knit_graph, start_on_left=True)
+        assert len(front_loops) == 2
+        assert len(back_loops) == 2
 
     def test_rib(self):
         execution, machine, knit_graph = run_knitout("rib.k")
-        print(execution)
-        print(machine.front_loops())
-        print(machine.back_loops())
-        visualize_stitches(knit_graph)
-        assert len(machine.front_loops()) == 2
-        assert len(machine.back_loops()) == 1
+        front_loops = machine.front_loops()
+        back_loops = machine.back_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("%s", front_loops)
+        _logger.debug("%s", back_loops)
+        _visualize_stitches(knit_graph)
+        assert len(front_loops) == 2
+        assert len(back_loops) == 1
 
     def test_split(self):
         execution, machine, knit_graph = run_knitout("split_pocket.k")
-        print(execution)
-        print(f"Courses: {knit_graph.get_courses()}")
-        print(f"Front Loops: {machine.front_loops()}")
-        print(f"Back Loops: {machine.back_loops()}")
-        print(f"In Front of Floats: {machine.carrier_system[1].yarn.loops_in_front_of_floats()}")
-        print(f"Behind Floats: {machine.carrier_system[1].yarn.loops_behind_floats()}")
-        visualize_stitches(knit_graph, start_on_left=True)
-        assert len(machine.front_loops()) == 4
-        assert len(machine.back_loops()) == 4
+        front_loops = machine.front_loops()
+        back_loops = machine.back_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("Courses: %s", knit_graph.get_courses())
+        _logger.debug("Front Loops: %s", front_loops)
+        _logger.debug("Back Loops: %s", back_loops)
+        _logger.debug("In Front of Floats: %s", machine.carrier_system[1].yarn.loops_in_front_of_floats())
+        _logger.debug("Behind Floats: %s", machine.carrier_system[1].yarn.loops_behind_floats())
+        _visualize_stitches(knit_graph, start_on_left=True)
+        assert len(front_loops) == 4
+        assert len(back_loops) == 4
 
     def test_lace(self):
         execution, machine, knit_graph = run_knitout("lace.k")
-        print(execution)
-        print(machine.front_loops())
-        print(machine.back_loops())
-        print(knit_graph.get_courses())
-        visualize_stitches(knit_graph)
-        assert len(knit_graph.get_courses()) == 4
-        assert len(machine.front_loops()) == 5
+        front_loops = machine.front_loops()
+        back_loops = machine.back_loops()
+        courses = knit_graph.get_courses()
+        _logger.debug("%s", execution)
+        _logger.debug("%s", front_loops)
+        _logger.debug("%s", back_loops)
+        _logger.debug("%s", courses)
+        _visualize_stitches(knit_graph)
+        assert len(courses) == 4
+        assert len(front_loops) == 5
 
     def test_jacquard(self):
         execution, machine, knit_graph = run_knitout("jacquard.k")
-        print(execution)
-        print(machine.front_loops())
-        print(machine.back_loops())
-        print(knit_graph.get_courses())
-        visualize_stitches(knit_graph)
+        front_loops = machine.front_loops()
+        back_loops = machine.back_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("%s", front_loops)
+        _logger.debug("%s", back_loops)
+        _logger.debug("%s", knit_graph.get_courses())
+        _visualize_stitches(knit_graph)
 
     def test_cable(self):
         execution, machine, knit_graph = run_knitout("cable.k")
-        print(execution)
-        print(machine.front_loops())
-        print(machine.back_loops())
-        print(knit_graph.get_courses())
-        visualize_stitches(knit_graph)
+        front_loops = machine.front_loops()
+        back_loops = machine.back_loops()
+        _logger.debug("%s", execution)
+        _logger.debug("%s", front_loops)
+        _logger.debug("%s", back_loops)
+        _logger.debug("%s", knit_graph.get_courses())
+        _visualize_stitches(knit_graph)
+
+    def test_misaligned_xfer(self):
+        machine = Knitting_Machine()
+        aligned_xfer, misaligned_xfer = parse_knitout("xfer f1 b1\nxfer f1 b2")
+        assert not aligned_xfer.execute(machine), f"Expected no loops to transfer with {aligned_xfer}"
+        with self.assertRaises(Misaligned_Needle_Exception):
+            misaligned_xfer.execute(machine)
@@ -1,59 +1,70 @@
 """Basic tests for the parsing of knitout."""
 
+import logging
 from unittest import TestCase
 
+from virtual_knitting_machine.machine_components.carriage_system.Carriage_Pass_Direction import Carriage_Pass_Direction
+from virtual_knitting_machine.machine_components.needles.Needle import Needle
+
 from knitout_interpreter.knitout_language.Knitout_Parser import parse_knitout
+from knitout_interpreter.knitout_operations.Knitout_Line import Knitout_Comment_Line
 from knitout_interpreter.knitout_operations.Rack_Instruction import Rack_Instruction
 
+_logger = logging.getLogger(__name__)
+
 
 class TestKnitout_Parser(TestCase):
     def test_knit_code(self):
         codes = parse_knitout("knit + f1 1")
         assert len(codes) == 1, f"Expected one knit but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
         codes = parse_knitout("knit + b2 2")
         assert len(codes) == 1, f"Expected one knit but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
         codes = parse_knitout("knit - b3 3")
         assert len(codes) == 1, f"Expected one knit but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
         codes = parse_knitout("knit + b3 4")
         assert len(codes) == 1, f"Expected one knit but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
 
     def test_tuck_code(self):
         codes = parse_knitout("tuck + f1 1")
         assert len(codes) == 1, f"Expected one tuck but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
         codes = parse_knitout("tuck + b2 2")
         assert len(codes) == 1, f"Expected one tuck but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
         codes = parse_knitout("tuck - b3 3")
         assert len(codes) == 1, f"Expected one tuck but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
         codes = parse_knitout("tuck + b3 4")
         assert len(codes) == 1, f"Expected one tuck but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
 
     def test_miss_code(self):
         codes = parse_knitout("miss + f1 1")
         assert len(codes) == 1, f"Expected one miss but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
 
     def test_split_code(self):
         codes = parse_knitout("split + f1 b2 1")
         assert len(codes) == 1, f"Expected one split but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
 
     def test_xfer_code(self):
         codes = parse_knitout("xfer f2 b2 ")
         assert len(codes) == 1, f"Expected one xfer but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
+        codes = parse_knitout("xfer f2 bs2")
+        assert len(codes) == 1, f"Expected one xfer but got: {codes}"
+        assert codes[0].needle_2.is_slider, f"Expected xfer to slider but got: {codes}"
+        _logger.debug("%s", codes)
 
     def test_drop_code(self):
         codes = parse_knitout("drop f2")
         assert len(codes) == 1, f"Expected one drop but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
 
     def test_carrier_ops(self):
         codes = parse_knitout(
@@ -63,42 +74,48 @@ class TestKnitout_Parser(TestCase):
             outhook 4
             releasehook 5""")
         assert len(codes) == 5, f"Expected five carrier operations but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
 
     def test_rack(self):
-        codes = parse_knitout("rack 1")
-        assert len(codes) == 1, f"Expected one rack operation but got: {codes}"
-        rack_code = codes[0]
-        assert isinstance(rack_code, Rack_Instruction), f"Expected rack operation but got {rack_code}"
-        assert rack_code.rack == 1, f"Expected rack of 1 but got {rack_code.rack} from {rack_code}"
-        assert not rack_code.all_needle_rack, f"Unexpected all-needle-rack from {rack_code}"
-        print(rack_code)
-        codes = parse_knitout("rack 0.25")
-        assert len(codes) == 1, f"Expected one rack operation but got: {codes}"
-        rack_code = codes[0]
-        assert isinstance(rack_code, Rack_Instruction), f"Expected rack operation but got {rack_code}"
-        assert rack_code.rack == 0, f"Expected rack of 0 but got {rack_code.rack} from {rack_code}"
-        assert rack_code.all_needle_rack, f"Expected all-needle-rack from {rack_code}"
-        print(rack_code)
-        codes = parse_knitout("rack -1")
-        assert len(codes) == 1, f"Expected one rack operation but got: {codes}"
-        rack_code = codes[0]
-        assert isinstance(rack_code, Rack_Instruction), f"Expected rack operation but got {rack_code}"
-        assert rack_code.rack == -1, f"Expected rack of -1 but got {rack_code.rack} from {rack_code}"
-        assert not rack_code.all_needle_rack, f"Unexpected all-needle-rack from {rack_code}"
-        print(rack_code)
-        codes = parse_knitout("rack -4.75")
-        assert len(codes) == 1, f"Expected one rack operation but got: {codes}"
-        rack_code = codes[0]
-        assert isinstance(rack_code, Rack_Instruction), f"Expected rack operation but got {rack_code}"
-        assert rack_code.rack == -4, f"Expected rack of 1 but got {rack_code.rack} from {rack_code}"
-        assert rack_code.all_needle_rack, f"Expected all-needle-rack from {rack_code}"
-        print(rack_code)
+        for knitout, expected_rack, expected_all_needle in [("rack 1", 1, False),
+                                                            ("rack 0.25", 0, True),
+                                                            ("rack -1", -1, False),
+                                                            ("rack -4.75", -4, True)]:
+            with self.subTest(knitout=knitout):
+                codes = parse_knitout(knitout)
+                assert len(codes) == 1, f"Expected one rack operation but got: {codes}"
+                rack_code = codes[0]
+                assert isinstance(rack_code, Rack_Instruction), f"Expected rack operation but got {rack_code}"
+                assert rack_code.rack == expected_rack, f"Expected rack of {expected_rack} but got {rack_code.rack} from {rack_code}"
+                assert rack_code.all_needle_rack == expected_all_needle, f"Expected all-needle-rack={expected_all_needle} from {rack_code}"
+                _logger.debug("%s", rack_code)
 
     def test_pause(self):
         codes = parse_knitout("pause")
         assert len(codes) == 1, f"Expected one pause but got: {codes}"
-        print(codes)
+        _logger.debug("%s", codes)
+
+    def test_no_op_comment(self):
+        codes = parse_knitout("pause;stop here\n;plain comment")
+        no_op = Knitout_Comment_Line(codes[0])
+        assert str(no_op) == ";No-Op:\tpause;stop here\n", f"Expected single line No-Op but got {str(no_op)!r}"
+        copied = Knitout_Comment_Line(codes[1])
+        assert str(copied) == ";plain comment\n", f"Expected copied comment but got {str(copied)!r}"
+
+    def test_header_str_after_update(self):
+        gauge = parse_knitout(";;Gauge: 15")[0]
+        gauge.header_value = 7
+        assert str(gauge) == ";;Gauge: 7\n", f"Expected updated gauge header but got {str(gauge)!r}"
+
+    def test_str_after_field_update(self):
+        knit, releasehook = parse_knitout("knit + f1 1\nreleasehook 2")
+        assert str(knit) == "knit + f1 1\n", f"Unexpected knit formatting {str(knit)!r}"
+        knit.needle = Needle(is_front=False, position=3)
+        knit.direction = Carriage_Pass_Direction.Leftward
+        assert str(knit) == "knit - b3 1\n", f"Expected updated knit but got {str(knit)!r}"
+        assert str(releasehook) == "releasehook 2\n", f"Unexpected releasehook formatting {str(releasehook)!r}"
+        releasehook.carrier_id = 4
+        assert str(releasehook) == "releasehook 4\n", f"Expected updated releasehook but got {str(releasehook)!r}"
 
     def test_basic_header(self):
         codes = parse_knitout(
@@ -109,4 +126,4 @@ class TestKnitout_Parser(TestCase):
                 ;;Carriers: 1 2 3 4 5 6 7 8 9 10
                 ;;Position: Right"""
         )
-        print(codes)
+        _logger.debug("%s", codes)